@@ -0,0 +1,98 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+
+import asyncio
+import ipaddress
+import logging
+from typing import AsyncIterator, Dict, List, Optional
+
+from pyasic.data import MinerData
+from pyasic.errors import APIError
+from pyasic.miners.base import AnyMiner
+
+
+class Scraper:
+    """A class to gather data from a fleet of miners with bounded concurrency.
+
+    Parameters:
+        max_concurrency: The maximum number of miners to gather data from at once.
+        max_per_subnet: The maximum number of miners in the same /24 subnet to gather data from at once.  Only applies to IPv4 miners.  Defaults to no per subnet limit.
+    """
+
+    def __init__(self, max_concurrency: int = 256, max_per_subnet: int = None):
+        self.max_concurrency = max_concurrency
+        self.max_per_subnet = max_per_subnet
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self._subnet_semaphores: Dict[ipaddress.IPv4Network, asyncio.Semaphore] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}: max_concurrency={self.max_concurrency}"
+
+    async def scrape(
+        self, miners: List[AnyMiner], **kwargs
+    ) -> AsyncIterator[MinerData]:
+        """
+        Gather data from each miner, yielding the results as they complete.
+
+        Parameters:
+            miners: The miners to gather data from.
+            **kwargs: Arguments passed to each miner's `get_data`, such as `include` or `ttl_ms`.
+
+        Returns:
+            An asynchronous generator containing the gathered data.  Miners that fail are logged and skipped.  Each miner's connections are closed once its data is gathered.
+        """
+        tasks = [
+            asyncio.create_task(self.get_data(miner, **kwargs)) for miner in miners
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                data = await task
+                if data is not None:
+                    yield data
+        finally:
+            # the caller may stop iterating early
+            for task in tasks:
+                task.cancel()
+
+    async def get_data(self, miner: AnyMiner, **kwargs) -> Optional[MinerData]:
+        try:
+            subnet_semaphore = self._get_subnet_semaphore(miner)
+            if subnet_semaphore is None:
+                async with self.semaphore:
+                    async with miner:
+                        return await miner.get_data(**kwargs)
+            # wait for the subnet first, so a busy subnet doesn't hold up global slots
+            async with subnet_semaphore:
+                async with self.semaphore:
+                    async with miner:
+                        return await miner.get_data(**kwargs)
+        except (APIError, OSError, asyncio.TimeoutError) as e:
+            logging.warning(f"{miner} - (Scraper) - Failed to get data: {e}")
+        except Exception as e:
+            # one broken miner must not stop the rest of the scrape
+            logging.warning(f"{miner} - (Scraper) - Unhandled exception: {e!r}")
+
+    def _get_subnet_semaphore(self, miner: AnyMiner) -> Optional[asyncio.Semaphore]:
+        if self.max_per_subnet is None:
+            return None
+        ip = ipaddress.ip_address(str(miner.ip))
+        # a /24 grouping only means something for IPv4
+        if ip.version != 4:
+            return None
+        subnet = ipaddress.ip_network(f"{ip}/24", strict=False)
+        if subnet not in self._subnet_semaphores:
+            self._subnet_semaphores[subnet] = asyncio.Semaphore(self.max_per_subnet)
+        return self._subnet_semaphores[subnet]
@@ -14,7 +14,9 @@
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
 
+import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import List, Optional
 
@@ -91,6 +93,19 @@ ANTMINER_MODERN_DATA_LOC = DataLocations(
 )
 
 
+def _nonzero_mean(values: List[float]) -> Optional[float]:
+    # single pass average, unpopulated sensors report 0
+    total = 0
+    count = 0
+    for value in values:
+        if value:
+            total += value
+            count += 1
+    if count:
+        return total / count
+    return None
+
+
 class AntminerModern(BMMiner):
     """Handler for AntMiners with the modern web interface, such as S19"""
 
@@ -108,24 +123,68 @@ class AntminerModern(BMMiner):
     supports_shutdown = True
     supports_power_modes = True
 
+    # when self.config was last read from, or confirmed by, the miner
+    _config_fetched_at: Optional[float] = None
+
     async def get_config(self) -> MinerConfig:
         data = await self.web.get_miner_conf()
         if data:
             self.config = MinerConfig.from_am_modern(data)
+            # the web API may have served a cached conf, use the time it was fetched
+            fetched_at = self.web.conf_fetched_at
+            self._config_fetched_at = fetched_at or time.monotonic()
         return self.config
 
+    async def _get_recent_config(self, max_age: float = 30) -> MinerConfig:
+        if (
+            self.config is not None
+            and self._config_fetched_at is not None
+            and time.monotonic() - self._config_fetched_at < max_age
+        ):
+            return self.config.model_copy(deep=True)
+        return await self.get_config()
+
     async def send_config(self, config: MinerConfig, user_suffix: str = None) -> None:
         self.config = config
-        await self.web.set_miner_conf(config.as_am_modern(user_suffix=user_suffix))
-        # if data:
-        #     if data.get("code") == "M000":
-        #         return
-        #
-        # for i in range(7):
-        #     data = await self.get_config()
-        #     if data == self.config:
-        #         break
-        #     await asyncio.sleep(1)
+        # not reusable until the miner confirms it
+        self._config_fetched_at = None
+        conf = config.as_am_modern(user_suffix=user_suffix)
+        data = await self.web.set_miner_conf(conf)
+        if not data or data.get("success") is False:
+            return
+        if data.get("code") == "M000":
+            self._config_fetched_at = time.monotonic()
+            return
+
+        # no ack, poll with backoff for up to 2 seconds until the miner reports the new config
+        # the miner reports the mode it was sent as bitmain-work-mode
+        expected = MinerConfig.from_am_modern(
+            {**conf, "bitmain-work-mode": str(conf.get("miner-mode", ""))}
+        )
+        deadline = time.monotonic() + 2
+        delay = 0.05
+        while time.monotonic() < deadline:
+            await asyncio.sleep(min(delay, deadline - time.monotonic()))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                # skip the cached conf, it can't show the change yet
+                current = await asyncio.wait_for(
+                    self.web.send_command("get_miner_conf"), timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                break
+            if (
+                current
+                and current.get("success") is not False
+                and "pools" in current
+                and MinerConfig.from_am_modern(current) == expected
+            ):
+                self._config_fetched_at = time.monotonic()
+                return
+            delay = min(delay * 2, 0.8)
+        logging.warning(f"{self} - Could not confirm that the new config was applied")
 
     async def upgrade_firmware(self, file: Path, keep_settings: bool = True) -> str:
         """
@@ -183,14 +242,14 @@ class AntminerModern(BMMiner):
         return False
 
     async def stop_mining(self) -> bool:
-        cfg = await self.get_config()
-        cfg.miner_mode = MiningModeConfig.sleep()
+        cfg = await self._get_recent_config()
+        cfg.mining_mode = MiningModeConfig.sleep()
         await self.send_config(cfg)
         return True
 
     async def resume_mining(self) -> bool:
-        cfg = await self.get_config()
-        cfg.miner_mode = MiningModeConfig.normal()
+        cfg = await self._get_recent_config()
+        cfg.mining_mode = MiningModeConfig.normal()
         await self.send_config(cfg)
         return True
 
@@ -248,37 +307,31 @@ class AntminerModern(BMMiner):
         return errors
 
     async def _get_hashboards(self) -> List[HashBoard]:
+        try:
+            rpc_stats = await self.rpc.stats(new_api=True)
+        except APIError:
+            rpc_stats = None
+
         hashboards = [
             HashBoard(slot=idx, expected_chips=self.expected_chips)
             for idx in range(self.expected_hashboards)
         ]
 
-        try:
-            rpc_stats = await self.rpc.stats(new_api=True)
-        except APIError:
-            return hashboards
-
         if rpc_stats is not None:
+            hashrate = self.algo.hashrate
+            unit_gh = self.algo.unit.GH
+            unit_default = self.algo.unit.default
             try:
                 for board in rpc_stats["STATS"][0]["chain"]:
-                    hashboards[board["index"]].hashrate = self.algo.hashrate(
-                        rate=board["rate_real"], unit=self.algo.unit.GH
-                    ).into(self.algo.unit.default)
-                    hashboards[board["index"]].chips = board["asic_num"]
-                    board_temp_data = list(
-                        filter(lambda x: not x == 0, board["temp_pcb"])
-                    )
-                    hashboards[board["index"]].temp = sum(board_temp_data) / len(
-                        board_temp_data
-                    )
-                    chip_temp_data = list(
-                        filter(lambda x: not x == 0, board["temp_chip"])
-                    )
-                    hashboards[board["index"]].chip_temp = sum(chip_temp_data) / len(
-                        chip_temp_data
+                    hb = hashboards[board["index"]]
+                    hb.hashrate = hashrate(rate=board["rate_real"], unit=unit_gh).into(
+                        unit_default
                     )
-                    hashboards[board["index"]].serial_number = board["sn"]
-                    hashboards[board["index"]].missing = False
+                    hb.chips = board["asic_num"]
+                    hb.temp = _nonzero_mean(board["temp_pcb"])
+                    hb.chip_temp = _nonzero_mean(board["temp_chip"])
+                    hb.serial_number = board["sn"]
+                    hb.missing = False
             except LookupError:
                 pass
         return hashboards
@@ -375,13 +428,11 @@ class AntminerModern(BMMiner):
 
         if web_get_conf is not None:
             try:
-                if str(web_get_conf["bitmain-work-mode"]).isdigit():
-                    return (
-                        False if int(web_get_conf["bitmain-work-mode"]) == 1 else True
-                    )
-                return False
+                return False if int(web_get_conf["bitmain-work-mode"]) == 1 else True
             except LookupError:
                 pass
+            except (ValueError, TypeError):
+                return False
 
     async def _get_uptime(self, rpc_stats: dict = None) -> Optional[int]:
         if rpc_stats is None:
@@ -481,6 +532,10 @@ class AntminerOld(CGMiner):
 
     data_locations = ANTMINER_OLD_DATA_LOC
 
+    # detected from the stats layout on the first scrape that reports them
+    _fan_offset: Optional[int] = None
+    _board_offset: Optional[int] = None
+
     async def get_config(self) -> MinerConfig:
         data = await self.web.get_miner_conf()
         if data:
@@ -570,20 +625,19 @@ class AntminerOld(CGMiner):
         fans_data = [Fan() for _ in range(self.expected_fans)]
         if rpc_stats is not None:
             try:
-                fan_offset = -1
-
-                for fan_num in range(1, 8, 4):
-                    for _f_num in range(4):
-                        f = rpc_stats["STATS"][1].get(f"fan{fan_num + _f_num}")
-                        if f and not f == 0 and fan_offset == -1:
-                            fan_offset = fan_num + 2
-                if fan_offset == -1:
-                    fan_offset = 3
+                stats = rpc_stats["STATS"][1]
+                fan_offset = self._fan_offset
+                if fan_offset is None:
+                    for fan_num in range(1, 8, 4):
+                        if any(stats.get(f"fan{fan_num + f}") for f in range(4)):
+                            # the layout doesn't change, only probe once per miner
+                            fan_offset = self._fan_offset = fan_num + 2
+                            break
+                    else:
+                        fan_offset = 3
 
                 for fan in range(self.expected_fans):
-                    fans_data[fan].speed = rpc_stats["STATS"][1].get(
-                        f"fan{fan_offset+fan}", 0
-                    )
+                    fans_data[fan].speed = stats.get(f"fan{fan_offset+fan}", 0)
             except LookupError:
                 pass
         return fans_data
@@ -599,17 +653,20 @@ class AntminerOld(CGMiner):
 
         if rpc_stats is not None:
             try:
-                board_offset = -1
                 boards = rpc_stats["STATS"]
                 if len(boards) > 1:
-                    for board_num in range(1, 16, 5):
-                        for _b_num in range(5):
-                            b = boards[1].get(f"chain_acn{board_num + _b_num}")
-
-                            if b and not b == 0 and board_offset == -1:
-                                board_offset = board_num
-                    if board_offset == -1:
-                        board_offset = 1
+                    board_offset = self._board_offset
+                    if board_offset is None:
+                        for board_num in range(1, 16, 5):
+                            if any(
+                                boards[1].get(f"chain_acn{board_num + b}")
+                                for b in range(5)
+                            ):
+                                # the layout doesn't change, only probe once per miner
+                                board_offset = self._board_offset = board_num
+                                break
+                        else:
+                            board_offset = 1
 
                     for i in range(
                         board_offset, board_offset + self.expected_hashboards
@@ -659,6 +716,8 @@ class AntminerOld(CGMiner):
                 return False if int(web_get_conf["bitmain-work-mode"]) == 1 else True
             except LookupError:
                 pass
+            except (ValueError, TypeError):
+                return False
 
         rpc_summary = None
         try:
@@ -15,6 +15,7 @@
 # ------------------------------------------------------------------------------
 import asyncio
 import ipaddress
+import time
 import warnings
 from typing import List, Optional, Protocol, Tuple, Type, TypeVar, Union
 
@@ -29,7 +30,6 @@ from pyasic.device.firmware import MinerFirmware
 from pyasic.device.makes import MinerMake
 from pyasic.device.models import MinerModelType
 from pyasic.errors import APIError
-from pyasic.logger import logger
 from pyasic.miners.data import DataLocations, DataOptions, RPCAPICommand, WebAPICommand
 
 
@@ -98,6 +98,20 @@ class MinerProtocol(Protocol):
     def api(self):
         return self.rpc
 
+    async def __aenter__(self):
+        # keep connections to the miner open until close()
+        if self.web is not None:
+            await self.web.__aenter__()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close any persistent connections to the miner, such as the web API client."""
+        if self.web is not None:
+            await self.web.close()
+
     async def check_light(self) -> bool:
         """Get the status of the fault light as a boolean.
 
@@ -440,35 +454,30 @@ class MinerProtocol(Protocol):
     ) -> dict:
         # handle include
         if include is not None:
-            include = [str(i) for i in include]
-        else:
-            # everything
-            include = [str(enum_value.value) for enum_value in DataOptions]
+            include = {str(i) for i in include}
 
         # handle exclude
         # prioritized over include, including x and excluding x will exclude x
         if exclude is not None:
-            for item in exclude:
-                if str(item) in include:
-                    include.remove(str(item))
+            exclude = {str(i) for i in exclude}
+
+        data_functions = [
+            (data_name, data_function)
+            for data_name, data_function in self.data_locations.items()
+            if (include is None or data_name in include)
+            and (exclude is None or data_name not in exclude)
+        ]
 
         rpc_multicommand = set()
         web_multicommand = set()
         # create multicommand
-        for data_name in include:
-            try:
-                # get kwargs needed for the _get_xyz function
-                fn_args = getattr(self.data_locations, data_name).kwargs
-
-                # keep track of which RPC/Web commands need to be sent
-                for arg in fn_args:
-                    if isinstance(arg, RPCAPICommand):
-                        rpc_multicommand.add(arg.cmd)
-                    if isinstance(arg, WebAPICommand):
-                        web_multicommand.add(arg.cmd)
-            except KeyError as e:
-                logger.error(type(e), e, data_name)
-                continue
+        for _, data_function in data_functions:
+            # keep track of which RPC/Web commands need to be sent
+            for arg in data_function.kwargs:
+                if isinstance(arg, RPCAPICommand):
+                    rpc_multicommand.add(arg.cmd)
+                if isinstance(arg, WebAPICommand):
+                    web_multicommand.add(arg.cmd)
 
         # create tasks for all commands that need to be sent, or no-op with sleep(0) -> None
         if len(rpc_multicommand) > 0:
@@ -495,37 +504,50 @@ class MinerProtocol(Protocol):
         if api_command_data is None:
             api_command_data = {}
 
-        miner_data = {}
+        data_tasks = {}
 
-        for data_name in include:
-            try:
-                fn_args = getattr(self.data_locations, data_name).kwargs
-                args_to_send = {k.name: None for k in fn_args}
-                for arg in fn_args:
-                    try:
-                        if isinstance(arg, RPCAPICommand):
-                            if api_command_data.get("multicommand"):
-                                args_to_send[arg.name] = api_command_data[arg.cmd][0]
+        for data_name, data_function in data_functions:
+            fn_args = data_function.kwargs
+            args_to_send = {k.name: None for k in fn_args}
+            for arg in fn_args:
+                try:
+                    if isinstance(arg, RPCAPICommand):
+                        if api_command_data.get("multicommand"):
+                            args_to_send[arg.name] = api_command_data[arg.cmd][0]
+                        else:
+                            args_to_send[arg.name] = api_command_data
+                    if isinstance(arg, WebAPICommand):
+                        if web_command_data is not None:
+                            if web_command_data.get("multicommand"):
+                                args_to_send[arg.name] = web_command_data[arg.cmd]
                             else:
-                                args_to_send[arg.name] = api_command_data
-                        if isinstance(arg, WebAPICommand):
-                            if web_command_data is not None:
-                                if web_command_data.get("multicommand"):
-                                    args_to_send[arg.name] = web_command_data[arg.cmd]
-                                else:
-                                    if not web_command_data == {"multicommand": False}:
-                                        args_to_send[arg.name] = web_command_data
-                    except LookupError:
-                        args_to_send[arg.name] = None
-            except LookupError:
-                continue
+                                if not web_command_data == {"multicommand": False}:
+                                    args_to_send[arg.name] = web_command_data
+                except LookupError:
+                    args_to_send[arg.name] = None
             try:
-                function = getattr(self, getattr(self.data_locations, data_name).cmd)
-                miner_data[data_name] = await function(**args_to_send)
+                function = getattr(self, data_function.cmd)
+                data_tasks[data_name] = asyncio.create_task(function(**args_to_send))
             except Exception as e:
+                for task in data_tasks.values():
+                    task.cancel()
                 raise APIError(
                     f"Failed to call {data_name} on {self} while getting data."
                 ) from e
+
+        # run the data functions concurrently, some of them send their own commands
+        # return_exceptions makes sure one failure doesn't cancel the others
+        results = await asyncio.gather(*data_tasks.values(), return_exceptions=True)
+
+        miner_data = {}
+        for data_name, result in zip(data_tasks, results):
+            if isinstance(result, Exception):
+                raise APIError(
+                    f"Failed to call {data_name} on {self} while getting data."
+                ) from result
+            if isinstance(result, BaseException):
+                raise result
+            miner_data[data_name] = result
         return miner_data
 
     async def get_data(
@@ -533,6 +555,7 @@ class MinerProtocol(Protocol):
         allow_warning: bool = False,
         include: List[Union[str, DataOptions]] = None,
         exclude: List[Union[str, DataOptions]] = None,
+        ttl_ms: int = 0,
     ) -> MinerData:
         """Get data from the miner in the form of [`MinerData`][pyasic.data.MinerData].
 
@@ -540,10 +563,21 @@ class MinerProtocol(Protocol):
             allow_warning: Allow warning when an API command fails.
             include: Names of data items you want to gather. Defaults to all data.
             exclude: Names of data items to exclude.  Exclusion happens after considering included items.
+            ttl_ms: Maximum age in milliseconds of a previously gathered snapshot that may be returned instead of querying the miner.  Defaults to 0, which always queries the miner.
 
         Returns:
             A [`MinerData`][pyasic.data.MinerData] instance containing data from the miner.
         """
+        cache_key = (
+            None if include is None else tuple(str(i) for i in include),
+            None if exclude is None else tuple(str(i) for i in exclude),
+        )
+        if ttl_ms > 0:
+            cached = self._data_cache.get(cache_key)
+            # compare against this caller's ttl, so a short ttl is never served a snapshot kept for a longer one
+            if cached is not None and (time.monotonic() - cached[0]) * 1000 < ttl_ms:
+                return cached[1].model_copy(deep=True)
+
         data = MinerData(
             ip=str(self.ip),
             device_info=self.device_info,
@@ -554,14 +588,6 @@ class MinerProtocol(Protocol):
             ),
             expected_hashboards=self.expected_hashboards,
             expected_fans=self.expected_fans,
-            hashboards=[
-                HashBoard(slot=i, expected_chips=self.expected_chips)
-                for i in range(
-                    self.expected_hashboards
-                    if self.expected_hashboards is not None
-                    else 0
-                )
-            ],
         )
 
         gathered_data = await self._get_data(
@@ -571,6 +597,23 @@ class MinerProtocol(Protocol):
             if gathered_data[item] is not None:
                 setattr(data, item, gathered_data[item])
 
+        # only create placeholder boards if none were gathered
+        if gathered_data.get("hashboards") is None:
+            data.hashboards = [
+                HashBoard(slot=i, expected_chips=self.expected_chips)
+                for i in range(
+                    self.expected_hashboards
+                    if self.expected_hashboards is not None
+                    else 0
+                )
+            ]
+
+        if ttl_ms > 0 or cache_key in self._data_cache:
+            # stamp after the query completes, so the snapshot age isn't understated
+            self._data_cache[cache_key] = (
+                time.monotonic(),
+                data.model_copy(deep=True),
+            )
         return data
 
 
@@ -578,6 +621,9 @@ class BaseMiner(MinerProtocol):
     def __init__(self, ip: str) -> None:
         self.ip = ip
 
+        # snapshots from get_data, keyed by include/exclude -> (monotonic time, MinerData)
+        self._data_cache = {}
+
         if self.expected_chips is None and self.raw_model is not None:
             warnings.warn(
                 f"Unknown chip count for miner type {self.raw_model}, "
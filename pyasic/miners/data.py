@@ -14,9 +14,9 @@
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
 
-from dataclasses import dataclass, field, make_dataclass
+from dataclasses import dataclass, field, fields, make_dataclass
 from enum import Enum
-from typing import List, Union
+from typing import List, Tuple, Union
 
 
 class DataOptions(Enum):
@@ -72,6 +72,15 @@ class DataFunction:
         return self
 
 
+def _data_locations_post_init(self) -> None:
+    # computed once, so get_data doesn't have to look up every option on each scrape
+    self._items = tuple((f.name, getattr(self, f.name)) for f in fields(self))
+
+
+def _data_locations_items(self) -> Tuple[Tuple[str, DataFunction], ...]:
+    return self._items
+
+
 DataLocations = make_dataclass(
     "DataLocations",
     [
@@ -82,4 +91,8 @@ DataLocations = make_dataclass(
         )
         for enum_value in DataOptions
     ],
+    namespace={
+        "__post_init__": _data_locations_post_init,
+        "items": _data_locations_items,
+    },
 )
@@ -20,7 +20,9 @@ import enum
 import ipaddress
 import json
 import re
+import time
 import warnings
+from collections import OrderedDict
 from typing import Any, AsyncGenerator, Callable
 
 import anyio
@@ -508,6 +510,40 @@ async def concurrent_get_first_result(tasks: list, verification_func: Callable)
 
 
 class MinerFactory:
+    def __init__(self) -> None:
+        # ip -> (monotonic time, miner type, miner model), least recently used first
+        self._cache: OrderedDict[str, tuple[float, MinerTypes, str]] = OrderedDict()
+
+    def clear_cached_miner(self, ip: str | ipaddress.ip_address) -> None:
+        """Remove the cached type of a miner, so it is identified again on the next `get_miner` call.
+
+        Parameters:
+            ip: The IP of the miner.
+        """
+        self._cache.pop(str(ip), None)
+
+    def clear_cache(self) -> None:
+        """Remove all cached miner types."""
+        self._cache.clear()
+
+    def _get_cached_miner_type(self, ip: str) -> tuple[MinerTypes, str] | None:
+        cached = self._cache.get(ip)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= settings.get("factory_cache_ttl", 0):
+            del self._cache[ip]
+            return None
+        self._cache.move_to_end(ip)
+        return cached[1], cached[2]
+
+    def _cache_miner_type(self, ip: str, miner_type: MinerTypes, miner_model: str):
+        if settings.get("factory_cache_ttl", 0) <= 0:
+            return
+        self._cache[ip] = (time.monotonic(), miner_type, miner_model)
+        self._cache.move_to_end(ip)
+        while len(self._cache) > settings.get("factory_cache_size", 10000):
+            self._cache.popitem(last=False)
+
     async def get_multiple_miners(
         self, ips: list[str], limit: int = 200
     ) -> list[AnyMiner]:
@@ -536,6 +572,12 @@ class MinerFactory:
     async def get_miner(self, ip: str | ipaddress.ip_address) -> AnyMiner | None:
         ip = str(ip)
 
+        cached = self._get_cached_miner_type(ip)
+        if cached is not None:
+            return self._select_miner_from_classes(
+                ip, miner_type=cached[0], miner_model=cached[1]
+            )
+
         miner_type = None
 
         for _ in range(settings.get("factory_get_retries", 1)):
@@ -580,6 +622,9 @@ class MinerFactory:
                     )
                 except asyncio.TimeoutError:
                     pass
+            # a missing model may work next time, only keep complete results
+            if miner_model is not None:
+                self._cache_miner_type(ip, miner_type, miner_model)
             miner = self._select_miner_from_classes(
                 ip,
                 miner_type=miner_type,
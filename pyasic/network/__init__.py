@@ -165,14 +165,21 @@ class MinerNetwork:
     @staticmethod
     async def _ping_and_get_miner(ip: ipaddress.ip_address) -> Union[None, AnyMiner]:
         try:
-            return await ping_and_get_miner(ip)
+            miner = await ping_and_get_miner(ip)
         except ConnectionRefusedError:
+            miner = None
             tasks = [ping_and_get_miner(ip, port=port) for port in [4028, 4029, 8889]]
-            for miner in asyncio.as_completed(tasks):
+            for task in asyncio.as_completed(tasks):
                 try:
-                    return await miner
+                    miner = await task
                 except ConnectionRefusedError:
-                    pass
+                    continue
+                if miner is not None:
+                    break
+        if miner is None:
+            # nothing answered, the miner may be replaced before it is seen again
+            miner_factory.clear_cached_miner(ip)
+        return miner
 
 
 async def ping_and_get_miner(
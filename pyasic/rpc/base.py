@@ -19,14 +19,23 @@ import ipaddress
 import json
 import logging
 import re
+import time
 import warnings
 from typing import Union
 
 from pyasic.errors import APIError, APIWarning
 from pyasic.misc import validate_command_output
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class BaseMinerRPCAPI:
+    # seconds to send split multicommands after a rejected joined one, before trying it again
+    _split_multicommand_ttl = 300
+
     def __init__(self, ip: str, port: int = 4028, api_ver: str = "0.0.0") -> None:
         # api port, should be 4028
         self.port = port
@@ -37,6 +46,9 @@ class BaseMinerRPCAPI:
 
         self.pwd = None
 
+        # when the miner last rejected the "command1+command2" multicommand format
+        self._split_multicommand_at = None
+
     def __new__(cls, *args, **kwargs):
         if cls is BaseMinerRPCAPI:
             raise TypeError(f"Only children of '{cls.__name__}' may be instantiated")
@@ -116,13 +128,35 @@ class BaseMinerRPCAPI:
         """
         # make sure we can actually run each command, otherwise they will fail
         commands = self._check_commands(*commands)
+        if (
+            self._split_multicommand_at is not None
+            and time.monotonic() - self._split_multicommand_at
+            < self._split_multicommand_ttl
+        ):
+            # this miner recently rejected the joined format, skip the extra round trip
+            data = await self._send_split_multicommand(
+                *commands, allow_warning=allow_warning
+            )
+            data["multicommand"] = True
+            return data
         # standard multicommand format is "command1+command2"
         # doesn't work for S19 which uses the backup _send_split_multicommand
         command = "+".join(commands)
         try:
             data = await self.send_command(command, allow_warning=allow_warning)
         except APIError:
-            data = await self._send_split_multicommand(*commands)
+            data = await self._send_split_multicommand(
+                *commands, allow_warning=allow_warning
+            )
+            # every command worked on its own, so the joined format is likely unsupported
+            # the error may have been transient though, so it is tried again after a while
+            if len(data) == len(commands) and all(v[0] for v in data.values()):
+                self._split_multicommand_at = time.monotonic()
+        else:
+            self._split_multicommand_at = None
+            # a single command isn't keyed by command name in the response
+            if len(commands) == 1:
+                data = {commands[0]: [data]}
         data["multicommand"] = True
         return data
 
@@ -203,6 +237,8 @@ If you are sure you want to use this command please use API.send_command("{comma
         if port is None:
             port = self.port
         logging.debug(f"{self} - ([Hidden] Send Bytes) - Sending")
+        # the RPC API answers a single command per connection and then closes the
+        # socket (the response is read until EOF), so connections can't be reused
         try:
             # get reader and writer streams
             reader, writer = await asyncio.open_connection(str(self.ip), port)
@@ -227,11 +263,14 @@ If you are sure you want to use this command please use API.send_command("{comma
         except TimeoutError:
             logging.warning(f"{self} - ([Hidden] Send Bytes) - Read timeout expired.")
             return b"{}"
-
-        # close the connection
-        logging.debug(f"{self} - ([Hidden] Send Bytes) - Closing")
-        writer.close()
-        await writer.wait_closed()
+        finally:
+            # close the connection, even on failure, so sockets aren't leaked
+            logging.debug(f"{self} - ([Hidden] Send Bytes) - Closing")
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
 
         return ret_data
 
@@ -284,6 +323,12 @@ If you are sure you want to use this command please use API.send_command("{comma
             str_data = str_data.replace("[", "{").replace("]", "}")
 
         # parse the json
+        if orjson is not None:
+            try:
+                return orjson.loads(str_data)
+            except orjson.JSONDecodeError:
+                # orjson is stricter (NaN, >64 bit ints), let the stdlib have a go
+                pass
         try:
             parsed_data = json.loads(str_data)
         except json.decoder.JSONDecodeError as e:
@@ -25,9 +25,13 @@ _settings = {  # defaults
     "network_scan_semaphore": None,
     "factory_get_retries": 1,
     "factory_get_timeout": 3,
+    "factory_cache_ttl": 0,
+    "factory_cache_size": 10000,
     "get_data_retries": 1,
     "api_function_timeout": 5,
     "antminer_mining_mode_as_str": False,
+    "antminer_web_conf_fresh_time": 0,
+    "antminer_web_conf_stale_time": 0,
     "default_whatsminer_rpc_password": "admin",
     "default_innosilicon_web_password": "admin",
     "default_antminer_web_password": "root",
@@ -49,8 +53,8 @@ ssl_cxt = httpx.create_ssl_context()
 
 # this function returns an AsyncHTTPTransport instance to perform asynchronous HTTP requests
 # using those options.
-def transport(verify: Union[str, bool, SSLContext] = ssl_cxt):
-    return AsyncHTTPTransport(verify=verify)
+def transport(verify: Union[str, bool, SSLContext] = ssl_cxt, **kwargs):
+    return AsyncHTTPTransport(verify=verify, **kwargs)
 
 
 def get(key: str, other: Any = None) -> Any:
@@ -16,7 +16,10 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
+import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +41,26 @@ class AntminerModernWebAPI(BaseWebAPI):
         self.username = "root"
         self.pwd = settings.get("default_antminer_web_password", "root")
 
+        # command -> (fetch time, data), see _get_cached
+        self._cache = {}
+        self._cache_tasks = {}
+        # bumped on invalidation, so requests started before a change aren't cached
+        self._cache_generation = {}
+
+    async def close(self) -> None:
+        """Cancel any background cache refreshes, and close the persistent HTTP client."""
+        # a refresh left running would open a new client after this one is closed
+        tasks = list(self._cache_tasks.values())
+        self._cache_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[task for task in tasks if task.get_loop() is loop],
+            return_exceptions=True,
+        )
+        await super().close()
+
     async def send_command(
         self,
         command: str | bytes,
@@ -59,10 +82,9 @@ class AntminerModernWebAPI(BaseWebAPI):
             dict: The JSON response from the device or an empty dictionary if an error occurs.
         """
         url = f"http://{self.ip}:{self.port}/cgi-bin/{command}.cgi"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
-
+            async with self._client_session() as client:
                 if parameters:
                     data = await client.post(
                         url,
@@ -95,7 +117,7 @@ class AntminerModernWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary containing the results of all commands executed.
         """
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
+        async with self._client_session() as client:
             tasks = [
                 asyncio.create_task(self._handle_multicommand(client, command))
                 for command in commands
@@ -121,7 +143,7 @@ class AntminerModernWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary containing the response of the executed command.
         """
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
 
         try:
             url = f"http://{self.ip}/cgi-bin/{command}.cgi"
@@ -137,13 +159,83 @@ class AntminerModernWebAPI(BaseWebAPI):
                     pass
         return {command: {}}
 
+    async def _get_cached(
+        self, command: str, fresh_time: float, stale_time: float = 0
+    ) -> dict:
+        # serve the cached result while fresh, and while stale with a background refresh
+        cached = self._cache.get(command)
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < fresh_time:
+                return copy.deepcopy(cached[1])
+            if age < stale_time:
+                task = self._cache_tasks.get(command)
+                if task is None or task.done():
+                    task = asyncio.create_task(self._refresh_cached(command))
+                    task.add_done_callback(self._log_refresh_error)
+                    self._cache_tasks[command] = task
+                return copy.deepcopy(cached[1])
+        if fresh_time <= 0 and stale_time <= 0:
+            return await self.send_command(command)
+        return await self._refresh_cached(command)
+
+    async def _refresh_cached(self, command: str) -> dict:
+        generation = self._cache_generation.get(command, 0)
+        data = await self.send_command(command)
+        if (
+            data
+            and data.get("success") is not False
+            and generation == self._cache_generation.get(command, 0)
+        ):
+            self._cache[command] = (time.monotonic(), copy.deepcopy(data))
+        return data
+
+    def _log_refresh_error(self, task: asyncio.Task) -> None:
+        # nothing awaits a background refresh, so report its failure here
+        if not task.cancelled() and task.exception() is not None:
+            logging.warning(
+                f"{self} - (Cache) - Background refresh failed: {task.exception()!r}"
+            )
+
+    def _get_cache_time(self, command: str) -> float | None:
+        # when the cached result of command was fetched, if there is one
+        cached = self._cache.get(command)
+        if cached is not None:
+            return cached[0]
+
+    def _invalidate_cached(self, command: str) -> None:
+        self._cache.pop(command, None)
+        self._cache_generation[command] = self._cache_generation.get(command, 0) + 1
+        task = self._cache_tasks.pop(command, None)
+        if task is not None:
+            task.cancel()
+
     async def get_miner_conf(self) -> dict:
         """Retrieve the miner configuration from the Antminer device.
 
+        The configuration can be cached, see the `antminer_web_conf_fresh_time` and
+        `antminer_web_conf_stale_time` settings.  A cached configuration younger than
+        the fresh time is returned directly, and one younger than the stale time is
+        returned while it is refreshed in the background.  Both default to 0, which
+        disables the cache.
+
         Returns:
             dict: A dictionary containing the current configuration of the miner.
         """
-        return await self.send_command("get_miner_conf")
+        return await self._get_cached(
+            "get_miner_conf",
+            fresh_time=settings.get("antminer_web_conf_fresh_time", 0),
+            stale_time=settings.get("antminer_web_conf_stale_time", 0),
+        )
+
+    @property
+    def conf_fetched_at(self) -> float | None:
+        """When the cached miner configuration was fetched, as a `time.monotonic()` value.
+
+        Returns:
+            float | None: The fetch time, or None if no configuration is cached.
+        """
+        return self._get_cache_time("get_miner_conf")
 
     async def set_miner_conf(self, conf: dict) -> dict:
         """Set the configuration for the miner.
@@ -154,7 +246,12 @@ class AntminerModernWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary response from the device after setting the configuration.
         """
-        return await self.send_command("set_miner_conf", **conf)
+        self._invalidate_cached("get_miner_conf")
+        try:
+            return await self.send_command("set_miner_conf", **conf)
+        finally:
+            # drop anything read while the change was being applied
+            self._invalidate_cached("get_miner_conf")
 
     async def blink(self, blink: bool) -> dict:
         """Control the blinking of the LED on the miner device.
@@ -188,10 +285,12 @@ class AntminerModernWebAPI(BaseWebAPI):
     async def get_network_info(self) -> dict:
         """Retrieve network configuration information from the miner.
 
+        The result is cached for 5 seconds, or until the network configuration is changed.
+
         Returns:
             dict: A dictionary containing the network configuration of the miner.
         """
-        return await self.send_command("get_network_info")
+        return await self._get_cached("get_network_info", fresh_time=5)
 
     async def summary(self) -> dict:
         """Get a summary of the miner's status and performance.
@@ -231,15 +330,19 @@ class AntminerModernWebAPI(BaseWebAPI):
         Returns:
             dict: A dictionary response from the device after setting the network configuration.
         """
-        return await self.send_command(
-            "set_network_conf",
-            ipAddress=ip,
-            ipDns=dns,
-            ipGateway=gateway,
-            ipHost=hostname,
-            ipPro=protocol,
-            ipSub=subnet_mask,
-        )
+        self._invalidate_cached("get_network_info")
+        try:
+            return await self.send_command(
+                "set_network_conf",
+                ipAddress=ip,
+                ipDns=dns,
+                ipGateway=gateway,
+                ipHost=hostname,
+                ipPro=protocol,
+                ipSub=subnet_mask,
+            )
+        finally:
+            self._invalidate_cached("get_network_info")
 
 
 class AntminerOldWebAPI(BaseWebAPI):
@@ -274,9 +377,9 @@ class AntminerOldWebAPI(BaseWebAPI):
             dict: The JSON response from the device or an empty dictionary if an error occurs.
         """
         url = f"http://{self.ip}:{self.port}/cgi-bin/{command}.cgi"
-        auth = httpx.DigestAuth(self.username, self.pwd)
+        auth = self._get_digest_auth()
         try:
-            async with httpx.AsyncClient(transport=settings.transport()) as client:
+            async with self._client_session() as client:
                 if parameters:
                     data = await client.post(
                         url,
@@ -309,22 +412,44 @@ class AntminerOldWebAPI(BaseWebAPI):
             dict: A dictionary containing the results of all commands executed.
         """
         data = {k: None for k in commands}
-        auth = httpx.DigestAuth(self.username, self.pwd)
-        async with httpx.AsyncClient(transport=settings.transport()) as client:
-            for command in commands:
+        async with self._client_session() as client:
+            tasks = [
+                asyncio.create_task(self._handle_multicommand(client, command))
+                for command in commands
+            ]
+            all_data = await asyncio.gather(*tasks)
+
+        for item in all_data:
+            data.update(item)
+        return data
+
+    async def _handle_multicommand(
+        self, client: httpx.AsyncClient, command: str
+    ) -> dict:
+        """Helper function for handling individual commands in a multicommand execution.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client to use for the request.
+            command (str): The command to be executed.
+
+        Returns:
+            dict: A dictionary containing the response of the executed command.
+        """
+        auth = self._get_digest_auth()
+
+        try:
+            url = f"http://{self.ip}/cgi-bin/{command}.cgi"
+            ret = await client.get(url, auth=auth)
+        except httpx.HTTPError:
+            pass
+        else:
+            if ret.status_code == 200:
                 try:
-                    url = f"http://{self.ip}/cgi-bin/{command}.cgi"
-                    ret = await client.get(url, auth=auth)
-                except httpx.HTTPError:
+                    json_data = ret.json()
+                    return {command: json_data}
+                except json.decoder.JSONDecodeError:
                     pass
-                else:
-                    if ret.status_code == 200:
-                        try:
-                            json_data = ret.json()
-                            data[command] = json_data
-                        except json.decoder.JSONDecodeError:
-                            pass
-        return data
+        return {command: None}
 
     async def get_system_info(self) -> dict:
         """Retrieve system information from the miner.
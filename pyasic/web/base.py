@@ -15,10 +15,15 @@
 # ------------------------------------------------------------------------------
 from __future__ import annotations
 
+import asyncio
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
+import httpx
+
+from pyasic import settings
 from pyasic.errors import APIWarning
 
 
@@ -32,6 +37,12 @@ class BaseWebAPI(ABC):
 
         self.token = None
 
+        # persistent client, only kept inside `async with`, see _client_session
+        self._keep_client = False
+        self._client = None
+        self._client_loop = None
+        self._auth = None
+
     def __new__(cls, *args, **kwargs):
         if cls is BaseWebAPI:
             raise TypeError(f"Only children of '{cls.__name__}' may be instantiated")
@@ -40,6 +51,79 @@ class BaseWebAPI(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}: {str(self.ip)}"
 
+    async def __aenter__(self):
+        # keep the HTTP client, and its connections, open until close()
+        self._keep_client = True
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the persistent HTTP client, if one is open."""
+        self._keep_client = False
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            client = self._client
+            self._client = None
+            self._client_loop = None
+            await client.aclose()
+        else:
+            self._discard_client()
+
+    def _discard_client(self) -> None:
+        # a client can only be closed on the event loop it was created on
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.is_closed:
+            return
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            warnings.warn(
+                f"{self}: HTTP client was not closed before its event loop finished, "
+                f"use `close()` or `async with` to release its connections.",
+                ResourceWarning,
+            )
+
+    @asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        # outside of `async with`, use a client per call so no idle connections are left open
+        if self._keep_client:
+            yield self._get_client()
+            return
+        async with httpx.AsyncClient(transport=settings.transport()) as client:
+            yield client
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # reuse one client per event loop, so connections to the miner are kept alive
+        # httpx requests gzip/deflate by default and decodes compressed responses itself
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._discard_client()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=settings.transport(
+                    limits=httpx.Limits(
+                        max_connections=None,
+                        max_keepalive_connections=4,
+                        keepalive_expiry=30,
+                    )
+                )
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _get_digest_auth(self) -> httpx.DigestAuth:
+        # reusing the auth object lets httpx answer the last challenge without a 401 round trip
+        if self._auth is None or self._auth[:2] != (self.username, self.pwd):
+            self._auth = (
+                self.username,
+                self.pwd,
+                httpx.DigestAuth(self.username, self.pwd),
+            )
+        return self._auth[2]
+
     @abstractmethod
     async def send_command(
         self,
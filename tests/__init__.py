@@ -15,9 +15,23 @@
 # ------------------------------------------------------------------------------
 
 from tests.config_tests import TestConfig
-from tests.miners_tests import MinersTest, TestHammerMiners
-from tests.network_tests import NetworkTest
+from tests.fleet_tests import TestScraper
+from tests.miners_tests import (
+    AntminerModeChangeTest,
+    AntminerSendConfigTest,
+    MinerDataCacheTest,
+    MinerFactoryCacheTest,
+    MinersTest,
+    TestHammerMiners,
+)
+from tests.network_tests import NetworkCacheTest, NetworkTest
 from tests.rpc_tests import *
+from tests.web_tests import (
+    TestAntminerWebClient,
+    TestAntminerWebClientClose,
+    TestAntminerWebConfCache,
+    TestAntminerWebNetworkCache,
+)
 
 if __name__ == "__main__":
     # `coverage run --source pyasic -m unittest discover` will give code coverage data
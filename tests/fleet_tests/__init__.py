@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pyasic import APIError
+from pyasic.data import MinerData
+from pyasic.fleet import Scraper
+from pyasic.miners.antminer import BMMinerS19
+
+
+class TestScraper(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def get_data(miner, **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if miner.ip == "10.0.0.1":
+                raise APIError("failed")
+            if miner.ip == "10.0.0.2":
+                raise KeyError("pools")
+            return MinerData(ip=miner.ip)
+
+        patcher = patch.object(BMMinerS19, "get_data", get_data)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_scrape_concurrency(self):
+        miners = [BMMinerS19(f"10.0.{i // 10}.{i % 10}") for i in range(30)]
+        scraper = Scraper(max_concurrency=8)
+        results = [data async for data in scraper.scrape(miners)]
+        # 10.0.0.1 and 10.0.0.2 fail
+        self.assertEqual(len(results), 28)
+        self.assertEqual(self.max_in_flight, 8)
+
+    async def test_scrape_subnet_concurrency(self):
+        miners = [BMMinerS19(f"10.0.0.{i}") for i in range(3, 23)]
+        scraper = Scraper(max_concurrency=8, max_per_subnet=3)
+        results = [data async for data in scraper.scrape(miners)]
+        self.assertEqual(len(results), 20)
+        self.assertEqual(self.max_in_flight, 3)
+
+    async def test_scrape_closes_miners(self):
+        miners = [BMMinerS19(f"10.0.0.{i}") for i in range(1, 4)]
+        with patch.object(BMMinerS19, "close") as mock_close:
+            results = [data async for data in Scraper().scrape(miners)]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(mock_close.call_count, 3)
+
+    async def test_scrape_skips_unexpected_errors(self):
+        miners = [BMMinerS19(f"10.0.0.{i}") for i in range(2, 6)]
+        with self.assertLogs(level="WARNING") as logs:
+            results = [data async for data in Scraper().scrape(miners)]
+        self.assertEqual(
+            sorted(d.ip for d in results), ["10.0.0.3", "10.0.0.4", "10.0.0.5"]
+        )
+        self.assertIn("KeyError", logs.output[0])
+
+    async def test_scrape_subnet_skips_bad_entries(self):
+        miners = [None, BMMinerS19("10.0.0.3"), BMMinerS19("10.0.0.4")]
+        scraper = Scraper(max_per_subnet=2)
+        with self.assertLogs(level="WARNING") as logs:
+            results = [data async for data in scraper.scrape(miners)]
+        self.assertEqual(sorted(d.ip for d in results), ["10.0.0.3", "10.0.0.4"])
+        self.assertIn("None", logs.output[0])
+
+    async def test_scrape_subnet_ignores_ipv6(self):
+        miners = [BMMinerS19("fd00::3"), BMMinerS19("fd00::4")]
+        scraper = Scraper(max_per_subnet=1)
+        results = [data async for data in scraper.scrape(miners)]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(self.max_in_flight, 2)
+        self.assertEqual(scraper._subnet_semaphores, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
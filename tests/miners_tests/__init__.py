@@ -13,12 +13,20 @@
 #  See the License for the specific language governing permissions and         -
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
+import asyncio
 import inspect
+import time
 import unittest
 import warnings
 from dataclasses import asdict
+from unittest.mock import patch
 
-from pyasic.miners.factory import MINER_CLASSES
+import httpx
+
+from pyasic import settings
+from pyasic.config import MinerConfig
+from pyasic.miners.antminer import BMMinerS19
+from pyasic.miners.factory import MINER_CLASSES, MinerFactory, MinerTypes
 
 from .backends_tests import *
 
@@ -147,5 +155,184 @@ class MinersTest(unittest.TestCase):
                         )
 
 
+class MinerDataCacheTest(unittest.IsolatedAsyncioTestCase):
+    @patch("pyasic.miners.base.MinerProtocol._get_data")
+    async def test_get_data_ttl(self, mock_get_data):
+        mock_get_data.return_value = {"hostname": "cached"}
+        miner = BMMinerS19("127.0.0.1")
+
+        await miner.get_data()
+        await miner.get_data()
+        self.assertEqual(mock_get_data.call_count, 2)
+
+        data = await miner.get_data(ttl_ms=60000)
+        self.assertEqual(mock_get_data.call_count, 3)
+        data.hostname = "changed"
+
+        data = await miner.get_data(ttl_ms=60000)
+        self.assertEqual(mock_get_data.call_count, 3)
+        self.assertEqual(data.hostname, "cached")
+
+        await miner.get_data(include=["hostname"], ttl_ms=60000)
+        self.assertEqual(mock_get_data.call_count, 4)
+
+        mock_get_data.return_value = {"hostname": "fresh"}
+        await asyncio.sleep(0.01)
+        data = await miner.get_data(ttl_ms=5)
+        self.assertEqual(mock_get_data.call_count, 5)
+        self.assertEqual(data.hostname, "fresh")
+
+
+class MinerFactoryCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._ttl = settings.get("factory_cache_ttl")
+        self._size = settings.get("factory_cache_size")
+        settings.update("factory_cache_ttl", 60)
+        settings.update("factory_cache_size", 1)
+
+    def tearDown(self):
+        settings.update("factory_cache_ttl", self._ttl)
+        settings.update("factory_cache_size", self._size)
+
+    @patch("pyasic.miners.factory.MinerFactory.get_miner_model_antminer")
+    @patch("pyasic.miners.factory.MinerFactory._get_miner_type")
+    async def test_get_miner_cached(self, mock_get_type, mock_get_model):
+        mock_get_type.return_value = MinerTypes.ANTMINER
+        mock_get_model.return_value = "ANTMINER S19"
+        factory = MinerFactory()
+
+        miner = await factory.get_miner("127.0.0.1")
+        self.assertIsInstance(miner, BMMinerS19)
+        miner = await factory.get_miner("127.0.0.1")
+        self.assertIsInstance(miner, BMMinerS19)
+        self.assertEqual(mock_get_type.call_count, 1)
+
+        factory.clear_cached_miner("127.0.0.1")
+        await factory.get_miner("127.0.0.1")
+        self.assertEqual(mock_get_type.call_count, 2)
+
+        # the cache only holds one miner, so the first is evicted
+        await factory.get_miner("127.0.0.2")
+        await factory.get_miner("127.0.0.1")
+        self.assertEqual(mock_get_type.call_count, 4)
+
+        settings.update("factory_cache_ttl", 0)
+        await factory.get_miner("127.0.0.1")
+        self.assertEqual(mock_get_type.call_count, 5)
+
+
+class AntminerModeChangeTest(unittest.IsolatedAsyncioTestCase):
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.get_miner_conf")
+    async def test_stop_resume_reuse_config(self, mock_get_conf, mock_set_conf):
+        mock_get_conf.return_value = {"pools": [], "bitmain-work-mode": "0"}
+        mock_set_conf.return_value = {"code": "M000"}
+        miner = BMMinerS19("127.0.0.1")
+
+        await miner.stop_mining()
+        await miner.resume_mining()
+        self.assertEqual(mock_get_conf.call_count, 1)
+        self.assertEqual(mock_set_conf.call_count, 2)
+        self.assertEqual(mock_set_conf.call_args.args[0]["miner-mode"], 0)
+
+        miner._config_fetched_at -= 30
+        await miner.stop_mining()
+        self.assertEqual(mock_get_conf.call_count, 2)
+
+    @patch(
+        "pyasic.settings.transport",
+        lambda *args, **kwargs: httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, json={"pools": [], "bitmain-work-mode": "0"}
+            )
+        ),
+    )
+    async def test_cached_conf_keeps_fetch_time(self):
+        stale_time = settings.get("antminer_web_conf_stale_time")
+        self.addCleanup(settings.update, "antminer_web_conf_stale_time", stale_time)
+        settings.update("antminer_web_conf_stale_time", 300)
+
+        async with BMMinerS19("127.0.0.1") as miner:
+            fetched_at = time.monotonic() - 200
+            with patch("pyasic.web.antminer.time.monotonic", return_value=fetched_at):
+                await miner.web.get_miner_conf()
+            self.assertEqual(miner.web.conf_fetched_at, fetched_at)
+
+            # served from the cache, so it is as old as the first fetch
+            await miner.get_config()
+            self.assertEqual(miner._config_fetched_at, fetched_at)
+
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.get_miner_conf")
+    async def test_failed_send_not_reused(self, mock_get_conf, mock_set_conf):
+        mock_get_conf.return_value = {"pools": [], "bitmain-work-mode": "0"}
+        mock_set_conf.return_value = {"success": False, "message": "failed"}
+        miner = BMMinerS19("127.0.0.1")
+
+        await miner.stop_mining()
+        self.assertIsNone(miner._config_fetched_at)
+        await miner.resume_mining()
+        self.assertEqual(mock_get_conf.call_count, 2)
+
+
+class AntminerSendConfigTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.miner = BMMinerS19("127.0.0.1")
+        # as reported back by the miner
+        self.conf = {**MinerConfig().as_am_modern(), "bitmain-work-mode": "0"}
+
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.send_command")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    async def test_ack(self, mock_set_conf, mock_send_command):
+        mock_set_conf.return_value = {"code": "M000"}
+        await self.miner.send_config(MinerConfig())
+        mock_send_command.assert_not_called()
+
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.send_command")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    async def test_failed(self, mock_set_conf, mock_send_command):
+        mock_set_conf.return_value = {"success": False, "message": "failed"}
+        await self.miner.send_config(MinerConfig())
+        mock_send_command.assert_not_called()
+
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.send_command")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    async def test_no_ack_polls(self, mock_set_conf, mock_send_command):
+        mock_set_conf.return_value = {"stats": "success"}
+        mock_send_command.side_effect = [
+            {"success": False, "message": "failed"},
+            {"stats": "success"},
+            self.conf,
+            self.conf,
+        ]
+        await self.miner.send_config(MinerConfig())
+        self.assertEqual(mock_send_command.call_count, 3)
+        self.assertIsNotNone(self.miner._config_fetched_at)
+
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.send_command")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    async def test_no_ack_time_limit(self, mock_set_conf, mock_send_command):
+        async def slow_send_command(*args, **kwargs):
+            await asyncio.sleep(1)
+            return {"success": False, "message": "failed"}
+
+        mock_set_conf.return_value = {"stats": "success"}
+        mock_send_command.side_effect = slow_send_command
+        start = time.monotonic()
+        with self.assertLogs(level="WARNING"):
+            await self.miner.send_config(MinerConfig())
+        self.assertLess(time.monotonic() - start, 2.5)
+
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.send_command")
+    @patch("pyasic.web.antminer.AntminerModernWebAPI.set_miner_conf")
+    async def test_no_ack_other_config(self, mock_set_conf, mock_send_command):
+        mock_set_conf.return_value = {"stats": "success"}
+        mock_send_command.return_value = {**self.conf, "bitmain-work-mode": "1"}
+        with self.assertLogs(level="WARNING") as logs:
+            await self.miner.send_config(MinerConfig())
+        self.assertIn("Could not confirm", logs.output[0])
+        self.assertIsNone(self.miner._config_fetched_at)
+
+
 if __name__ == "__main__":
     unittest.main()
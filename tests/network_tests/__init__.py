@@ -14,8 +14,10 @@
 #  limitations under the License.                                              -
 # ------------------------------------------------------------------------------
 
+import asyncio
 import ipaddress
 import unittest
+from unittest.mock import patch
 
 from pyasic.network import MinerNetwork
 
@@ -74,5 +76,37 @@ class NetworkTest(unittest.TestCase):
         )
 
 
+class NetworkCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.miner = object()
+        self.refused = set()
+
+        async def ping(ip, port=80):
+            # let the refused ports race the successful one
+            await asyncio.sleep(0 if port in self.refused else 0.01)
+            if port in self.refused:
+                raise ConnectionRefusedError
+            return self.miner
+
+        ping_patcher = patch("pyasic.network.ping_and_get_miner", ping)
+        ping_patcher.start()
+        self.addCleanup(ping_patcher.stop)
+        clear_patcher = patch("pyasic.network.miner_factory.clear_cached_miner")
+        self.mock_clear = clear_patcher.start()
+        self.addCleanup(clear_patcher.stop)
+
+    async def test_kept_when_fallback_port_answers(self):
+        self.refused = {80, 4029, 8889}
+        miner = await MinerNetwork._ping_and_get_miner("192.168.1.1")
+        self.assertIs(miner, self.miner)
+        self.mock_clear.assert_not_called()
+
+    async def test_cleared_when_no_port_answers(self):
+        self.refused = {80, 4028, 4029, 8889}
+        miner = await MinerNetwork._ping_and_get_miner("192.168.1.1")
+        self.assertIsNone(miner)
+        self.mock_clear.assert_called_once_with("192.168.1.1")
+
+
 if __name__ == "__main__":
     unittest.main()
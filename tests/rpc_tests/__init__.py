@@ -172,5 +172,80 @@ class TestLuxOSAPI(TestAPIBase):
         self.api_str = "LuxOS"
 
 
+class TestRPCMulticommand(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = CGMinerRPCAPI("10.0.0.50")
+
+    def get_success_value(self, command: str):
+        return json.dumps(
+            {
+                "STATUS": [{"STATUS": "S", "When": time.time(), "Code": 69}],
+                command.upper(): [{command: "test"}],
+                "id": 1,
+            }
+        ).encode("utf-8")
+
+    @patch("pyasic.rpc.base.BaseMinerRPCAPI._send_bytes")
+    async def test_single_command_keyed_by_name(self, mock_send_bytes):
+        mock_send_bytes.return_value = self.get_success_value("summary")
+        data = await self.api.multicommand("summary")
+        self.assertEqual(data["summary"][0]["SUMMARY"], [{"summary": "test"}])
+
+    @patch("pyasic.rpc.base.BaseMinerRPCAPI._send_bytes")
+    async def test_split_multicommand_remembered(self, mock_send_bytes):
+        async def send_bytes(data: bytes, **kwargs):
+            command = json.loads(data)["command"]
+            if "+" in command:
+                return json.dumps(
+                    {"STATUS": [{"STATUS": "E", "Code": 14, "Msg": "Invalid"}]}
+                ).encode("utf-8")
+            return self.get_success_value(command)
+
+        mock_send_bytes.side_effect = send_bytes
+
+        data = await self.api.multicommand("summary", "pools", allow_warning=False)
+        self.assertEqual(data["pools"][0]["POOLS"], [{"pools": "test"}])
+        self.assertEqual(mock_send_bytes.call_count, 3)
+
+        mock_send_bytes.reset_mock()
+        data = await self.api.multicommand("summary", "pools", allow_warning=False)
+        self.assertEqual(data["summary"][0]["SUMMARY"], [{"summary": "test"}])
+        self.assertEqual(mock_send_bytes.call_count, 2)
+
+    @patch("pyasic.rpc.base.BaseMinerRPCAPI._send_bytes")
+    async def test_joined_multicommand_retried(self, mock_send_bytes):
+        joined_failures = [
+            json.dumps({"STATUS": [{"STATUS": "E", "Msg": "Invalid"}]}).encode("utf-8")
+        ]
+
+        async def send_bytes(data: bytes, **kwargs):
+            command = json.loads(data)["command"]
+            if "+" in command:
+                if joined_failures:
+                    return joined_failures.pop()
+                return json.dumps(
+                    {
+                        "summary": [json.loads(self.get_success_value("summary"))],
+                        "pools": [json.loads(self.get_success_value("pools"))],
+                        "id": 1,
+                    }
+                ).encode("utf-8")
+            return self.get_success_value(command)
+
+        mock_send_bytes.side_effect = send_bytes
+
+        # a transient error splits the next multicommand
+        await self.api.multicommand("summary", "pools", allow_warning=False)
+        self.assertIsNotNone(self.api._split_multicommand_at)
+
+        # until the joined format is tried again
+        self.api._split_multicommand_at -= self.api._split_multicommand_ttl
+        mock_send_bytes.reset_mock()
+        data = await self.api.multicommand("summary", "pools", allow_warning=False)
+        self.assertEqual(data["pools"][0]["POOLS"], [{"pools": "test"}])
+        self.assertEqual(mock_send_bytes.call_count, 1)
+        self.assertIsNone(self.api._split_multicommand_at)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,265 @@
+# ------------------------------------------------------------------------------
+#  Copyright 2022 Upstream Data Inc                                            -
+#                                                                              -
+#  Licensed under the Apache License, Version 2.0 (the "License");             -
+#  you may not use this file except in compliance with the License.            -
+#  You may obtain a copy of the License at                                     -
+#                                                                              -
+#      http://www.apache.org/licenses/LICENSE-2.0                              -
+#                                                                              -
+#  Unless required by applicable law or agreed to in writing, software         -
+#  distributed under the License is distributed on an "AS IS" BASIS,           -
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.    -
+#  See the License for the specific language governing permissions and         -
+#  limitations under the License.                                              -
+# ------------------------------------------------------------------------------
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from pyasic import settings
+from pyasic.miners.antminer import BMMinerS19
+from pyasic.web.antminer import AntminerModernWebAPI
+
+
+class MockTransportTestCase(unittest.TestCase):
+    """Sends the web API requests to `handler`, instead of the network."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch(
+            "pyasic.settings.transport",
+            lambda *args, **kwargs: httpx.MockTransport(self.handler),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"hostname": "Antminer"})
+
+
+class TestAntminerWebClient(MockTransportTestCase, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if "Authorization" not in request.headers:
+            return httpx.Response(
+                401,
+                headers={
+                    "WWW-Authenticate": 'Digest realm="antMiner Configuration", nonce="abc", qop="auth"'
+                },
+            )
+        return super().handler(request)
+
+    async def test_client_and_auth_reused(self):
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            data = await web.get_system_info()
+            self.assertEqual(data, {"hostname": "Antminer"})
+            client = web._client
+            self.assertEqual(len(self.requests), 2)
+
+            await web.get_system_info()
+            self.assertIs(web._client, client)
+            # the digest challenge is answered without another 401
+            self.assertEqual(len(self.requests), 3)
+        self.assertTrue(client.is_closed)
+
+    async def test_compressed_responses_accepted(self):
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_system_info()
+            self.assertIn("gzip", self.requests[-1].headers["Accept-Encoding"])
+
+    async def test_auth_updated_with_password(self):
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_system_info()
+            web.pwd = "new_password"
+            await web.get_system_info()
+            self.assertEqual(len(self.requests), 4)
+
+
+class TestAntminerWebClientClose(MockTransportTestCase):
+    def test_miner_closes_web_client(self):
+        async def scrape():
+            async with BMMinerS19("10.0.0.50") as miner:
+                await miner.web.get_system_info()
+                return miner.web._client
+
+        client = asyncio.run(scrape())
+        self.assertTrue(client.is_closed)
+
+    def test_no_client_kept_by_default(self):
+        web = AntminerModernWebAPI("10.0.0.50")
+        asyncio.run(web.get_system_info())
+        asyncio.run(web.multicommand("get_system_info", "summary"))
+        self.assertIsNone(web._client)
+
+    def test_client_closed_on_its_loop(self):
+        web = AntminerModernWebAPI("10.0.0.50")
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(web.__aenter__())
+        loop.run_until_complete(web.get_system_info())
+        client = web._client
+
+        asyncio.run(web.get_system_info())
+        self.assertIsNot(web._client, client)
+        # the old client is closed once its loop runs again
+        loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(client.is_closed)
+
+    def test_warns_when_loop_finished(self):
+        web = AntminerModernWebAPI("10.0.0.50")
+        asyncio.run(web.__aenter__())
+        asyncio.run(web.get_system_info())
+        with self.assertWarns(ResourceWarning):
+            asyncio.run(web.close())
+        self.assertIsNone(web._client)
+
+
+class TestAntminerWebConfCache(MockTransportTestCase, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        self.conf_requests = 0
+        self.conf = {"pools": [], "bitmain-work-mode": "0"}
+        self.set_started = asyncio.Event()
+        self.set_done = asyncio.Event()
+        self.conf_started = asyncio.Event()
+        self.conf_done = None
+
+        fresh_time = settings.get("antminer_web_conf_fresh_time")
+        stale_time = settings.get("antminer_web_conf_stale_time")
+        self.addCleanup(settings.update, "antminer_web_conf_fresh_time", fresh_time)
+        self.addCleanup(settings.update, "antminer_web_conf_stale_time", stale_time)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/cgi-bin/get_miner_conf.cgi":
+            self.conf_requests += 1
+            self.conf_started.set()
+            if self.conf_done is not None:
+                await self.conf_done.wait()
+            return httpx.Response(200, json=self.conf)
+        self.set_started.set()
+        await self.set_done.wait()
+        self.conf = {"pools": [], "bitmain-work-mode": "1"}
+        return httpx.Response(200, json={"code": "M000"})
+
+    async def test_disabled_by_default(self):
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_miner_conf()
+            await web.get_miner_conf()
+            self.assertEqual(self.conf_requests, 2)
+            self.assertIsNone(web.conf_fetched_at)
+
+    async def test_fresh(self):
+        settings.update("antminer_web_conf_fresh_time", 60)
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            data = await web.get_miner_conf()
+            data["pools"].append("changed")
+            data = await web.get_miner_conf()
+            self.assertEqual(self.conf_requests, 1)
+            self.assertEqual(data["pools"], [])
+
+    async def test_stale_refreshed_in_background(self):
+        settings.update("antminer_web_conf_stale_time", 60)
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_miner_conf()
+            self.conf = {"pools": [], "bitmain-work-mode": "1"}
+
+            data = await web.get_miner_conf()
+            self.assertEqual(data["bitmain-work-mode"], "0")
+            await web._cache_tasks["get_miner_conf"]
+            self.assertEqual(self.conf_requests, 2)
+
+            data = await web.get_miner_conf()
+            self.assertEqual(data["bitmain-work-mode"], "1")
+
+    async def test_close_cancels_refresh(self):
+        settings.update("antminer_web_conf_stale_time", 60)
+        web = AntminerModernWebAPI("10.0.0.50")
+        async with web:
+            await web.get_miner_conf()
+            self.conf_started.clear()
+            self.conf_done = asyncio.Event()
+            await web.get_miner_conf()
+            task = web._cache_tasks["get_miner_conf"]
+            await self.conf_started.wait()
+        self.assertTrue(task.cancelled())
+        self.assertEqual(web._cache_tasks, {})
+        self.assertIsNone(web._client)
+
+    async def test_refresh_error_logged(self):
+        settings.update("antminer_web_conf_stale_time", 60)
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_miner_conf()
+            with patch.object(web, "send_command", side_effect=RuntimeError("boom")):
+                with self.assertLogs(level="WARNING") as logs:
+                    await web.get_miner_conf()
+                    await asyncio.gather(
+                        web._cache_tasks["get_miner_conf"], return_exceptions=True
+                    )
+                    await asyncio.sleep(0)
+            self.assertIn("boom", logs.output[0])
+
+    async def test_invalidated_by_set(self):
+        settings.update("antminer_web_conf_fresh_time", 60)
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_miner_conf()
+            set_task = asyncio.create_task(web.set_miner_conf({"miner-mode": 1}))
+            await self.set_started.wait()
+            # read while the change is being applied
+            data = await web.get_miner_conf()
+            self.assertEqual(data["bitmain-work-mode"], "0")
+            self.set_done.set()
+            await set_task
+
+            data = await web.get_miner_conf()
+            self.assertEqual(data["bitmain-work-mode"], "1")
+            self.assertEqual(self.conf_requests, 3)
+
+
+class TestAntminerWebNetworkCache(
+    MockTransportTestCase, unittest.IsolatedAsyncioTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self.info_requests = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/cgi-bin/get_network_info.cgi":
+            self.info_requests += 1
+            return httpx.Response(200, json={"ipaddress": "10.0.0.50"})
+        return httpx.Response(200, json={"stats": "success"})
+
+    async def test_cached_for_ttl(self):
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_network_info()
+            await web.get_network_info()
+            self.assertEqual(self.info_requests, 1)
+
+            with patch("pyasic.web.antminer.time.monotonic") as mock_monotonic:
+                mock_monotonic.return_value = web._cache["get_network_info"][0] + 5
+                await web.get_network_info()
+            self.assertEqual(self.info_requests, 2)
+
+    async def test_invalidated_by_set(self):
+        async with AntminerModernWebAPI("10.0.0.50") as web:
+            await web.get_network_info()
+            await web.set_network_conf(
+                ip="10.0.0.51",
+                dns="10.0.0.1",
+                gateway="10.0.0.1",
+                subnet_mask="255.255.255.0",
+                hostname="Antminer",
+                protocol=2,
+            )
+            await web.get_network_info()
+            self.assertEqual(self.info_requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()